@@ -1,10 +1,18 @@
 import asyncio # Locking write access.
 import datetime as dt # Getting the date.
+import functools # Caching formatted hour strings.
+import itertools # Truncating user data lists without slice copies.
 import json # De-/Serializing.
+import mmap # Copy-free read of the data file at startup.
+import operator # Prebound attribute access for sort keys.
 import os # Checking whether a file exists.
-import statistics as stats # Computing median etc.
+import re # Classifying `HH:MM` input.
 import collections
-import random
+
+try:
+    import orjson # Fast de-/serializing of the data file.
+except ImportError:
+    orjson = None
 
 import discord
 from discord.ext import commands
@@ -18,6 +26,29 @@ CONFIG = {}
 DATA_FILE = "sleeptober-bot_data.json"
 # Writer lock for data file.
 DATA_FILE_LOCK = asyncio.Lock()
+# Path to file journaling individual sleep records between compactions.
+JOURNAL_FILE = "sleeptober-bot_journal.jsonl"
+# Number of journaled records not yet compacted into the data file.
+JOURNAL_LENGTH = 0
+# How many journaled records to allow before compacting into the data file.
+JOURNAL_COMPACT_THRESHOLD = 256
+# Queue feeding sleep records to the background journal writer.
+WRITE_QUEUE = asyncio.Queue()
+# Set whenever DATA_CACHE has changes not yet persisted to disk.
+DATA_DIRTY = asyncio.Event()
+# Background tasks persisting journal records and dirty data, spawned on_ready.
+JOURNAL_WRITER = None
+DATA_FLUSHER = None
+# In-memory cache of the sleep data; the bot is the sole writer, so this stays authoritative after the first load.
+DATA_CACHE = None
+# Memoized per-user sleep stats; maps user id to (data fingerprint, SleepStats).
+STATS_CACHE = {}
+# Version counter for the sleep data, bumped on every write.
+DATA_VERSION = 0
+# Cached leaderboard renders; maps render arguments to (data version, text), cleared on every data write.
+LEADERBOARD_CACHE = {}
+# Compiled code objects for repeated sudo invocations.
+SUDO_CACHE = {}
 
 # A simple color palette for the bot to use.
 COLORS = {
@@ -35,6 +66,15 @@ EMOJIS = {
 
 COMMAND_PREFIX = ">>="
 
+# Precomputed confirmation codes for `profile reset`, indexed by (user_id >> 22) % 26.
+RESET_CODES = tuple("abcdefghijklmnopqrstuvwxyzabc"[i:i+4] for i in range(26))
+
+# Recognizes times given in `HH:MM` format.
+HHMM_RE = re.compile(r"(\d+):(\d+)")
+
+# Template for a fresh month of unlogged sleep data.
+EMPTY_USER_DATA = (None,)*31
+
 DESCRIPTION = f"""Sleeptober
 
 Official 2024 Prompt List:
@@ -65,7 +105,7 @@ intents.message_content = True
 
 bot = commands.Bot(
     command_prefix=COMMAND_PREFIX,
-    description=DESCRIPTION,
+    description=f"Sleeptober sleep tracker - see `{COMMAND_PREFIX}about` for the full challenge info.",
     intents=intents,
 )
 
@@ -83,10 +123,51 @@ SleepStats = collections.namedtuple("SleepStats", [
     "debug",
 ])
 
+# All valid leaderboard sort arguments (order sign followed by a stat name).
+VALID_SORT_CRITERIA = frozenset(f"{order}{field}" for order in "+-" for field in SleepStats._fields)
+
+# Static reply texts, formatted once at import time.
+SLEPT_USAGE = f"""Basic usage:
+- "I slept a healthy 8.5h last night {EMOJIS["bedge"]}" → `{COMMAND_PREFIX}slept 8.5`
+- "Oof! I forgot to log 7h 56min for the 4th-to-5th night" → `{COMMAND_PREFIX}slept 7:56 4`"""
+
+LEADERBOARD_USAGE = f"""Advanced leaderboard usage: `{COMMAND_PREFIX}lb sortOrderAndStat minDaysLogged showTopUsers`
+- *Sort orders:* `-` for descending, `+` for ascending.
+- *Statistics to sort by:* {", ".join(f"`{field}`" for field in SleepStats._fields)}.
+Examples:
+- "Sort downwards by average sleep" → `{COMMAND_PREFIX}lb -mean`.
+- "Sleep deviation for people who slept at least 7 days in ascending order" → `{COMMAND_PREFIX}lb +deviation 7`.
+- "Basically show the entire leaderboard (≥0 days logged, ≤999 people)" → `{COMMAND_PREFIX}lb -score 0 999`."""
+
+LEADERBOARD_TIP = """\n-# Tip: Achieve a better overall score by logging more days and minimizing your total sleep deficit (<8h) and -surplus (>9h, but punished less)."""
+
+RESET_PROMPT = f"Are you sure you want to delete your data? It will be lost forever! (A long time!) – Type `{COMMAND_PREFIX}profile reset {{}}` to confirm"
+
+# Leaderboard entry formatters for the sort stats without a standard format.
+LEADERBOARD_STAT_FMTS = {
+    # "days": lambda ss: f"{ss.days}d",
+    "min": lambda ss: f"min. {fmt_hours(ss.min)} h.",
+    "max": lambda ss: f"max. {fmt_hours(ss.max)} h.",
+    # "mean": lambda ss: f"avg. {fmt_hours(ss.mean)} h.",
+    "median": lambda ss: f"mdn. {fmt_hours(ss.median)} h.",
+    "deviation": lambda ss: f"dev. {fmt_hours(ss.deviation)} h.",
+    # "deficit": lambda ss: f"`{f'-{fmt_hours_f(ss.deficit)}': >6}`",
+    # "surplus": lambda ss: f"`{f'+{fmt_hours_f(ss.surplus)}': >6}`",
+    "score": lambda ss: f"`{ss.score:.02f}`☆",
+}
+
+def fmt_user_stats_default(user_id, sleep_stats):
+    """Standard leaderboard entry formatter (deficit, surplus, mean)."""
+    deficit_str = f"-{fmt_hours(sleep_stats.deficit)}".rjust(6)
+    surplus_str = f"+{fmt_hours(sleep_stats.surplus)}".rjust(6)
+    return f"`{deficit_str}` `{surplus_str}` ~ {fmt_hours(sleep_stats.mean)} h. <@{user_id}> ({sleep_stats.days}d)"
+
+@functools.lru_cache(maxsize=1024)
 def fmt_hours_f(hours):
     """Format 6.50069 hours as "6.50"."""
     return f"{hours:2.2f}"
 
+@functools.lru_cache(maxsize=1024)
 def fmt_hours(hours):
     """Format 6.50069 hours as "6:30"."""
     minutes = round(hours * 60)
@@ -94,25 +175,192 @@ def fmt_hours(hours):
     mm = minutes % 60
     return f"{hh}:{mm:02}"
 
+def parse_hours_hhmm(text):
+    """Parse a time given as `HH:MM` into hours, or None if invalid."""
+    match = HHMM_RE.fullmatch(text)
+    if match is None:
+        return None
+    [hh,mm] = [int(match[1]), int(match[2])]
+    if not (0 <= hh < 24 and 0 <= mm < 60 or hh == 24 and mm == 0):
+        return None
+    return hh + mm / 60
+
+def render_bar_row(quarter_hours):
+    """Render the ASCII sleep bar for a night of `quarter_hours` quarter hours."""
+    chars = ['│'] + 7*[' '] + 2*['┆'] + 14*[' '] + ['│']
+    if 0 < quarter_hours:
+        if 2 <= quarter_hours:
+            chars[0] = '▐'
+            quarter_hours -= 2
+        else:
+            chars[0] = '🮇' # " ▕🮇🮈▐🮉🮊🮋█"
+            quarter_hours = 0
+    i = 1
+    while 0 < quarter_hours:
+        if 4 <= quarter_hours:
+            chars[i] = '█'
+            quarter_hours -= 4
+        else:
+            chars[i] = "▎▌▊"[quarter_hours-1] # " ▏▎▍▌▋▊▉█"
+            quarter_hours = 0
+        i += 1
+    return ''.join(chars)
+
+# Prerendered ASCII sleep bars for every possible quarter-hour amount (0h..24h).
+BAR_ROWS = tuple(render_bar_row(quarter_hours) for quarter_hours in range(24*4 + 1))
+
 def load_data():
     """Filesystem load of global sleep data."""
-    with open(DATA_FILE, 'r') as file:
-        data = json.load(file)
+    if orjson is not None:
+        with open(DATA_FILE, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = orjson.loads(memoryview(mapped))
+    else:
+        with open(DATA_FILE, 'r') as file:
+            data = json.load(file)
     return data
 
 def store_data(data):
-    """Filesystem store of global sleep data."""
-    with open(DATA_FILE, 'w') as file:
-        json.dump(data, file, indent=4)
+    """Filesystem store of global sleep data, atomically via a temporary file."""
+    tmp_file = f"{DATA_FILE}.tmp.{os.getpid()}"
+    if orjson is not None:
+        with open(tmp_file, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_file, 'w') as file:
+            json.dump(data, file, indent=4)
+    os.replace(tmp_file, DATA_FILE)
+
+async def get_data():
+    """Get the global sleep data, lazily loading it from the filesystem on first access."""
+    global DATA_CACHE
+    if DATA_CACHE is None:
+        async with DATA_FILE_LOCK:
+            if DATA_CACHE is None:
+                DATA_CACHE = load_data()
+                replay_journal(DATA_CACHE)
+    return DATA_CACHE
+
+def append_journal(records):
+    """Append sleep records to the journal file in one write (O(1) instead of rewriting the whole data file)."""
+    global JOURNAL_LENGTH
+    if orjson is not None:
+        lines = b"".join(orjson.dumps(record) + b"\n" for record in records)
+    else:
+        lines = "".join(json.dumps(record) + "\n" for record in records).encode()
+    with open(JOURNAL_FILE, 'ab') as file:
+        file.write(lines)
+    JOURNAL_LENGTH += len(records)
+
+def replay_journal(data):
+    """Replay journal records not yet compacted into the data file onto freshly loaded data."""
+    global JOURNAL_LENGTH
+    if not os.path.exists(JOURNAL_FILE):
+        return
+    with open(JOURNAL_FILE, 'rb') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = orjson.loads(line) if orjson is not None else json.loads(line)
+            if record.get("reset"):
+                data.pop(record["user_id"], None)
+            else:
+                user_data = data.get(record["user_id"])
+                if user_data is None:
+                    user_data = list(EMPTY_USER_DATA)
+                    data[record["user_id"]] = user_data
+                user_data[record["date_index"]] = record["hours"]
+            JOURNAL_LENGTH += 1
+
+def truncate_journal():
+    """Clear the journal after its records have been compacted into the data file."""
+    global JOURNAL_LENGTH
+    open(JOURNAL_FILE, 'wb').close()
+    JOURNAL_LENGTH = 0
+
+async def write_journal_forever():
+    """Background writer which journals queued sleep records, batching bursts into one disk write."""
+    while True:
+        records = [await WRITE_QUEUE.get()]
+        while not WRITE_QUEUE.empty():
+            records.append(WRITE_QUEUE.get_nowait())
+        try:
+            async with DATA_FILE_LOCK:
+                await asyncio.to_thread(append_journal, records)
+        except Exception as error:
+            # The records still live in DATA_CACHE, so fall back to a full store.
+            print(f"[ Journal write failed ({error!r}), scheduling a full flush. ]")
+            DATA_DIRTY.set()
+            continue
+        if JOURNAL_COMPACT_THRESHOLD <= JOURNAL_LENGTH:
+            DATA_DIRTY.set()
+
+async def flush_data_forever():
+    """Background writer which compacts DATA_CACHE to disk whenever it is marked dirty.
+
+    Bursts of writes collapse into one disk store, and the blocking file I/O
+    happens on a worker thread instead of the event loop.
+    """
+    while True:
+        await DATA_DIRTY.wait()
+        DATA_DIRTY.clear()
+        try:
+            async with DATA_FILE_LOCK:
+                snapshot = {user_id: list(user_data) for (user_id, user_data) in DATA_CACHE.items()}
+                await asyncio.to_thread(store_data, snapshot)
+                truncate_journal()
+        except Exception as error:
+            print(f"[ Data flush failed ({error!r}), retrying in 60s. ]")
+            await asyncio.sleep(60)
+            DATA_DIRTY.set()
+
+def get_sleep_stats(user_id, user_data, days):
+    """Memoized compute_sleep_stats over the first `days` entries, keyed per user on the truncated data itself."""
+    truncated = tuple(itertools.islice(user_data, days))
+    cached = STATS_CACHE.get(user_id)
+    if cached is not None and cached[0] == truncated:
+        return cached[1]
+    sleep_stats = compute_sleep_stats(truncated)
+    STATS_CACHE[user_id] = (truncated, sleep_stats)
+    return sleep_stats
+
+def build_global_leaderboard(data_items, current_date_index, sort_stat, sort_down, min_days):
+    """Compute the sorted global leaderboard from a snapshot of the data items.
+
+    Pure CPU work, safe to run off the event loop — callers must pass a
+    snapshotted list (not a live dict view), since commands on the event loop
+    may add or remove users while this runs on a worker thread.
+    """
+    sort_key = operator.attrgetter(sort_stat)
+    return sorted(
+        (
+            (
+                user_id,
+                sleep_stats,
+            )
+            for (user_id, user_data) in data_items
+            if (sleep_stats:=get_sleep_stats(user_id, user_data, current_date_index+1)).days >= min_days
+        ),
+        key=lambda id_stats: sort_key(id_stats[1]),
+        reverse=sort_down
+    )
+
+# Memoized (shifted date, index) pair for get_sleeptober_index.
+SLEEPTOBER_INDEX_CACHE = (None, None)
 
 def get_sleeptober_index():
     """Get the index of the currently relevant day (usually yesterday), or None if yesterday was not part of October."""
+    global SLEEPTOBER_INDEX_CACHE
     # FIXME: We're manually correct for UTC+2 hour difference.
-    yesterday = dt.datetime.now() - dt.timedelta(hours=22)
+    yesterday = (dt.datetime.now() - dt.timedelta(hours=22)).date()
+    if SLEEPTOBER_INDEX_CACHE[0] == yesterday:
+        return SLEEPTOBER_INDEX_CACHE[1]
     if yesterday.month == 10:
-        return yesterday.day - 1
+        index = yesterday.day - 1
     else:
-        return None
+        index = None
+    SLEEPTOBER_INDEX_CACHE = (yesterday, index)
+    return index
 
 def get_saturating_sleeptober_index():
     sleeptober_index = get_sleeptober_index()
@@ -121,26 +369,38 @@ def get_saturating_sleeptober_index():
 
 def compute_sleep_stats(user_data):
     """Compute some SleepStats from user's raw hours-slept-each-night data with at least one data point."""
-    hours = [h for h in user_data if h is not None]
-    days_logged = len(hours)
-    days_unlogged = len(user_data) - days_logged
-    hours_min = min(hours)
-    hours_max = max(hours)
-
-    hours_mean = stats.mean(hours)
-    hours_median = stats.median(hours)
-    hours_variance = sum(h**2 for h in hours)/days_logged - hours_mean**2
-    hours_deviation = hours_variance**.5
-
-    hours_deficit = 0
-    hours_surplus = 0
     LOWER = 8
     UPPER = 9
-    for h in hours:
+    # Single fused pass (Welford's recurrence for the numerically stable variance).
+    hours = []
+    days_unlogged = 0
+    hours_min = 24.0
+    hours_max = 0.0
+    hours_mean = 0.0
+    hours_m2 = 0.0
+    hours_deficit = 0
+    hours_surplus = 0
+    for h in user_data:
+        if h is None:
+            days_unlogged += 1
+            continue
+        hours.append(h)
+        delta = h - hours_mean
+        hours_mean += delta / len(hours)
+        hours_m2 += (h - hours_mean) * delta
+        if h < hours_min:
+            hours_min = h
+        if hours_max < h:
+            hours_max = h
         if h < LOWER:
             hours_deficit += LOWER - h
         elif UPPER < h:
             hours_surplus += h - UPPER
+    days_logged = len(hours)
+    hours_variance = hours_m2 / days_logged
+    hours_deviation = hours_variance**.5
+    hours.sort()
+    hours_median = (hours[days_logged//2] if days_logged % 2 else (hours[days_logged//2 - 1] + hours[days_logged//2]) / 2)
     # Compute legacy Sleeptober score,
     legacy_score = 1000 * days_logged - hours_deficit - hours_surplus / 2
     # Compute Sleeptober score,
@@ -177,8 +437,18 @@ def compute_sleep_stats(user_data):
 
 @bot.event
 async def on_ready():
+    global JOURNAL_WRITER, DATA_FLUSHER
+    if JOURNAL_WRITER is None:
+        JOURNAL_WRITER = asyncio.create_task(write_journal_forever())
+    if DATA_FLUSHER is None:
+        DATA_FLUSHER = asyncio.create_task(flush_data_forever())
     print(f"[ '{bot.user}' ({bot.user.id}) is ready. ]")
 
+@bot.command()
+async def about(ctx):
+    """Shows the full Sleeptober challenge info."""
+    await ctx.send(DESCRIPTION)
+
 @bot.command(aliases=["sleep","s",":3"])
 async def slept(
         ctx,
@@ -186,6 +456,7 @@ async def slept(
         night: None | str = commands.parameter(description="Night to manually write, in the range [1, <yesterday>], defaults to last night."),
     ):
     """Saves how many hours you slept last night."""
+    global DATA_VERSION
     print(f"[ s {hours_slept=} {night=} @ {dt.datetime.now().strftime('%Y-%m-%d_%Hh%Mm%S')} ]")
     # Compute who is being logged.
     if ctx.message.author.bot:
@@ -196,30 +467,22 @@ async def slept(
 
     # Compute how many hours of sleep are being logged.
     if hours_slept is None:
-        await ctx.message.reply(f"""Basic usage:
-- "I slept a healthy 8.5h last night {EMOJIS["bedge"]}" → `{COMMAND_PREFIX}slept 8.5`
-- "Oof! I forgot to log 7h 56min for the 4th-to-5th night" → `{COMMAND_PREFIX}slept 7:56 4`""")
+        await ctx.message.reply(SLEPT_USAGE)
         return
 
-    # Try parsing as float.
-    try:
-        hours = float(hours_slept)
-        if not 0 <= hours <= 24:
-            await ctx.message.add_reaction('🙅')
-            await ctx.message.reply("(Turns out you can only sleep between [0.0, 24.0]h a day)", delete_after=60)
-            return
-    except:
-        # Try parsing as `HH:MM`.
+    # Try parsing as `HH:MM` (classified upfront by regex), falling back to float.
+    hours = parse_hours_hhmm(hours_slept)
+    if hours is None:
         try:
-            [hh,mm] = hours_slept.split(':')
-            [hh,mm] = [int(hh), int(mm)]
-            if not (0 <= hh < 24 and 0 <= mm < 60 or hh == 24 and mm == 0):
-                raise ValueError
-            hours = hh + mm / 60
-        except:
+            hours = float(hours_slept)
+        except ValueError:
             await ctx.message.add_reaction('🙅')
             await ctx.message.reply(f"(That's not a valid time in `HH:MM` or floating point format)", delete_after=60)
             return
+    if not 0 <= hours <= 24:
+        await ctx.message.add_reaction('🙅')
+        await ctx.message.reply("(Turns out you can only sleep between [0.0, 24.0]h a day)", delete_after=60)
+        return
 
     # Compute which day is being logged.
     if night is not None:
@@ -228,7 +491,7 @@ async def slept(
             date_index = int(night) - 1
             if not (0 <= date_index <= date_index_cap):
                 raise ValueError
-        except:
+        except ValueError:
             await ctx.message.add_reaction('🙅')
             await ctx.message.reply(f"(If you want to specify the night you're logging (second argument) it needs to be an integer in the range [1, {date_index_cap+1}])", delete_after=60)
             return
@@ -241,10 +504,18 @@ async def slept(
             return
 
     # Do the logging.
+    author_user_id_str = str(author_user_id)
+    data = await get_data()
     async with DATA_FILE_LOCK:
-        data = load_data()
-        data.setdefault(str(author_user_id), [None for _ in range(31)])[date_index] = hours
-        store_data(data)
+        user_data = data.get(author_user_id_str)
+        if user_data is None:
+            user_data = list(EMPTY_USER_DATA)
+            data[author_user_id_str] = user_data
+        user_data[date_index] = hours
+        STATS_CACHE.pop(author_user_id_str, None)
+        DATA_VERSION += 1
+        LEADERBOARD_CACHE.clear()
+        WRITE_QUEUE.put_nowait({"user_id": author_user_id_str, "date_index": date_index, "hours": hours})
 
     # Reaction for visual feedback on success.
     if hours == 0.0:
@@ -274,7 +545,7 @@ async def profile(
                 await ctx.message.add_reaction("🤖")
                 return
             target_user_id = ctx.message.author.id
-        data = load_data()
+        data = await get_data()
         user_data = data.get(str(target_user_id))
 
         # Generate profile.
@@ -289,46 +560,30 @@ async def profile(
             sleeptober_over = len(user_data) == 31
             fully_slept = sum(1 for x in user_data if x is not None) == 31
             if fully_slept:
-                text = f"""### *⋆ ﾟ☁ ｡✧ fully slept ★ ﾟ☾｡⋆*
+                parts = [f"""### *⋆ ﾟ☁ ｡✧ fully slept ★ ﾟ☾｡⋆*
 -# We hope you had fun and wish you much success
--# in future endeavours of becoming well-rested {EMOJIS['bedge']}💤\n"""
+-# in future endeavours of becoming well-rested {EMOJIS['bedge']}💤\n"""]
             else:
-                text = ""
+                parts = []
 
             # Add ASCII graph.
             (maxwidth_day_index, maxwidth_hours) = (len(str(len(user_data))), 5)
-            text += "```c\n"
-            text += f"{' ': >{maxwidth_day_index}}  {' ': >{maxwidth_hours}} ┍{7*'┯'}┳┳{14*'┯'}┑\n"
+            parts.append("```c\n")
+            parts.append(f"{' ': >{maxwidth_day_index}}  {' ': >{maxwidth_hours}} ┍{7*'┯'}┳┳{14*'┯'}┑\n")
             for day_index, hours in enumerate(user_data):
                 quarter_hours = round(hours * 4) if hours is not None else 0
-                chars = ['│'] + 7*[' '] + 2*['┆'] + 14*[' '] + ['│']
-                if 0 < quarter_hours:
-                    if 2 <= quarter_hours:
-                        chars[0] = '▐'
-                        quarter_hours -= 2
-                    else:
-                        chars[0] = '🮇' # " ▕🮇🮈▐🮉🮊🮋█"
-                        quarter_hours = 0
-                i = 1
-                while 0 < quarter_hours:
-                    if 4 <= quarter_hours:
-                        chars[i] = '█'
-                        quarter_hours -= 4
-                    else:
-                        chars[i] = "▎▌▊"[quarter_hours-1] # " ▏▎▍▌▋▊▉█"
-                        quarter_hours = 0
-                    i += 1
-                text += f"{day_index+1: >{maxwidth_day_index}}. {fmt_hours(hours) if hours is not None else '?': >{maxwidth_hours}} {''.join(chars)}\n"
+                parts.append(f"{day_index+1: >{maxwidth_day_index}}. {fmt_hours(hours) if hours is not None else '?': >{maxwidth_hours}} {BAR_ROWS[quarter_hours]}\n")
             if sleeptober_over:
-                text += f"{' ': >{maxwidth_day_index}}  {' ': >{maxwidth_hours}} ┕{7*'┷'}┻┻{14*'┷'}┙\n"
-            text += "```\n"
+                parts.append(f"{' ': >{maxwidth_day_index}}  {' ': >{maxwidth_hours}} ┕{7*'┷'}┻┻{14*'┷'}┙\n")
+            parts.append("```\n")
 
             # Add value summary.
             sleep_stats = compute_sleep_stats(user_data)
-            text += f"""Sleep statistics
+            parts.append(f"""Sleep statistics
 * `{sleep_stats.days}` days logged, Mean `{fmt_hours(sleep_stats.mean)}` h, Median `{fmt_hours(sleep_stats.median)}` h.
 * Total short of 8h `-{fmt_hours(sleep_stats.deficit)}` h, Total above 9h `+{fmt_hours(sleep_stats.surplus)}` h.
-* Min `{fmt_hours(sleep_stats.min)}` h, Max `{fmt_hours(sleep_stats.max)}` h, Deviation `{fmt_hours(sleep_stats.deviation)}` h."""
+* Min `{fmt_hours(sleep_stats.min)}` h, Max `{fmt_hours(sleep_stats.max)}` h, Deviation `{fmt_hours(sleep_stats.deviation)}` h.""")
+            text = ''.join(parts)
 
         # Assemble and send embed.
         embed = discord.Embed(
@@ -346,7 +601,7 @@ async def raw(ctx):
         await ctx.message.add_reaction("🤖")
         return
     user_id = ctx.message.author.id
-    data = load_data()
+    data = await get_data()
     user_data = data.get(str(user_id))
 
     await ctx.message.add_reaction('✅')
@@ -358,23 +613,27 @@ async def reset(
         confirm_code: str | None = commands.parameter(description="-"),
     ):
     """Used to reset (delete) one's data."""
+    global DATA_VERSION
     # Load user data.
     if ctx.message.author.bot:
         await ctx.message.add_reaction("🤖")
         return
     author_user_id = ctx.message.author.id
-    i = (author_user_id >> 22) % 26
-    confirm_code_expected = "abcdefghijklmnopqrstuvwxyzabc"[i:i+4]
+    confirm_code_expected = RESET_CODES[(author_user_id >> 22) % 26]
 
     # Ask user for confirmation or delete directly.
     if confirm_code is None:
-        await ctx.message.reply(f"Are you sure you want to delete your data? It will be lost forever! (A long time!) – Type `{COMMAND_PREFIX}profile reset {confirm_code_expected}` to confirm", delete_after=60)
+        await ctx.message.reply(RESET_PROMPT.format(confirm_code_expected), delete_after=60)
     elif confirm_code == confirm_code_expected:
         # Do the deleting.
+        author_user_id_str = str(author_user_id)
+        data = await get_data()
         async with DATA_FILE_LOCK:
-            data = load_data()
-            data.pop(str(author_user_id), None)
-            store_data(data)
+            data.pop(author_user_id_str, None)
+            STATS_CACHE.pop(author_user_id_str, None)
+            DATA_VERSION += 1
+            LEADERBOARD_CACHE.clear()
+            WRITE_QUEUE.put_nowait({"user_id": author_user_id_str, "reset": True})
         await ctx.message.add_reaction('✅')
         await ctx.message.reply("(Your data has been reset)", delete_after=60)
     else:
@@ -398,99 +657,76 @@ async def leaderboard(
         current_date_index = get_saturating_sleeptober_index()
         min_days = max(0, min(min_days, current_date_index+1))
 
-        # Handle stat sorting and formatting mechanism.
-        # Initialize standard user stats formatter.
-        fmt_user_stats = lambda user_id, sleep_stats: f"""`{f'-{fmt_hours(sleep_stats.deficit)}': >6}` `{f'+{fmt_hours(sleep_stats.surplus)}': >6}` ~ {fmt_hours(sleep_stats.mean)} h. <@{user_id}> ({sleep_stats.days}d)"""
+        # Handle stat sorting mechanism.
         if sort_criteria is None:
             sort_stat = "score"
             sort_down = True
         else:
-            if not (sort_criteria.startswith("+") or sort_criteria.startswith("-")) or sort_criteria[1:] not in SleepStats._fields:
-                await ctx.message.reply(f"""Advanced leaderboard usage: `{COMMAND_PREFIX}lb sortOrderAndStat minDaysLogged showTopUsers`
-- *Sort orders:* `-` for descending, `+` for ascending.
-- *Statistics to sort by:* {", ".join(f"`{field}`" for field in SleepStats._fields)}.
-Examples:
-- "Sort downwards by average sleep" → `{COMMAND_PREFIX}lb -mean`.
-- "Sleep deviation for people who slept at least 7 days in ascending order" → `{COMMAND_PREFIX}lb +deviation 7`.
-- "Basically show the entire leaderboard (≥0 days logged, ≤999 people)" → `{COMMAND_PREFIX}lb -score 0 999`.""")
+            if sort_criteria not in VALID_SORT_CRITERIA:
+                await ctx.message.reply(LEADERBOARD_USAGE)
                 return
             sort_stat = sort_criteria[1:]
             sort_down = sort_criteria[0] == "-"
-            if sort_stat not in {"days","mean","deficit","surplus"}:
-                fmt_stats = {
-                    # "days": lambda ss: f"{ss.days}d",
-                    "min": lambda ss: f"min. {fmt_hours(ss.min)} h.",
-                    "max": lambda ss: f"max. {fmt_hours(ss.max)} h.",
-                    # "mean": lambda ss: f"avg. {fmt_hours(ss.mean)} h.",
-                    "median": lambda ss: f"mdn. {fmt_hours(ss.median)} h.",
-                    "deviation": lambda ss: f"dev. {fmt_hours(ss.deviation)} h.",
-                    # "deficit": lambda ss: f"`{f'-{fmt_hours_f(ss.deficit)}': >6}`",
-                    # "surplus": lambda ss: f"`{f'+{fmt_hours_f(ss.surplus)}': >6}`",
-                    "score": lambda ss: f"`{ss.score:.02f}`☆",
-                }.get(sort_stat, lambda ss: f"`{getattr(ss, sort_stat)}`(?)") # Fallback formatter.
-                fmt_user_stats = lambda user_id, sleep_stats: f"""{fmt_stats(sleep_stats)} <@{user_id}> ({sleep_stats.days}d)"""
-
-        if sort_criteria is not None:
-            text = f"""-# Sorted in {"descending" if sort_down else "ascending"} order by `{sort_stat}`{f" (and ≥{min_days}d)" if min_days > 1 else ""}.\n"""
-        else:
-            text = """-# *Shown:* `-deficit` `+surplus` ~ avg. sleep <user> (days logged).\n"""
 
-        data = load_data()
-        if not data:
-            text += "\n...seems like nobody has slept yet(??) (be the first → `{COMMAND_PREFIX}slept`)"
+        # Reuse the cached render if the data hasn't changed since it was built.
+        show_top_n = max(show_top_n, 0)
+        cache_key = (target_user_id, sort_criteria, min_days, show_top_n, current_date_index)
+        cached = LEADERBOARD_CACHE.get(cache_key)
+        if cached is not None and cached[0] == DATA_VERSION:
+            (_, text) = cached
         else:
-            # Load global leaderboard data, sorted as determined above.
-            global_leaderboard = sorted(
-                (
-                    (
-                        user_id,
-                        sleep_stats,
-                    )
-                    for (user_id, user_data) in data.items()
-                    if (sleep_stats:=compute_sleep_stats(user_data[:current_date_index+1])).days >= min_days
-                ),
-                key=lambda id_stats: getattr(id_stats[1], sort_stat),
-                reverse=sort_down
-            )
-            # Find user position on leaderboard.
-            user_index = 0
-            while user_index < len(global_leaderboard) and global_leaderboard[user_index][0] != str(target_user_id):
-                user_index += 1
-            # Format leaderboard preview.
-            fmt_leaderboard_entries = lambda entries, rank_offset: '\n'.join(
-                    f"""{1+rank_offset+i}. {"**" if rank_offset+i == user_index else ""}{fmt_user_stats(user_id, sleep_stats)}{"**" if rank_offset+i == user_index else ""}"""
-                    for i, (user_id, sleep_stats) in enumerate(entries)
-                )
-            show_top_n = max(show_top_n, 0)
-            USER_PREVIEW_WINDOW = 2
-            if user_index-USER_PREVIEW_WINDOW <= show_top_n+1:
-                leaderboard_top = global_leaderboard[:max(show_top_n,user_index+USER_PREVIEW_WINDOW+1)]
-                leaderboard_chunk = []
+            # Handle stat formatting mechanism.
+            fmt_user_stats = fmt_user_stats_default
+            if sort_criteria is not None and sort_stat not in {"days","mean","deficit","surplus"}:
+                fmt_stats = LEADERBOARD_STAT_FMTS.get(sort_stat)
+                if fmt_stats is None:
+                    fmt_stats = lambda ss: f"`{getattr(ss, sort_stat)}`(?)" # Fallback formatter.
+                def fmt_user_stats(user_id, sleep_stats):
+                    return f"{fmt_stats(sleep_stats)} <@{user_id}> ({sleep_stats.days}d)"
+
+            if sort_criteria is not None:
+                parts = [f"""-# Sorted in {"descending" if sort_down else "ascending"} order by `{sort_stat}`{f" (and ≥{min_days}d)" if min_days > 1 else ""}.\n"""]
             else:
-                leaderboard_top = global_leaderboard[:show_top_n]
-                leaderboard_chunk = global_leaderboard[user_index-USER_PREVIEW_WINDOW:user_index+USER_PREVIEW_WINDOW+1]
-            text += f"{fmt_leaderboard_entries(leaderboard_top, 0)}\n"
-            if len(leaderboard_top) < len(global_leaderboard):
-                text += "⋅ ⋅ ⋅\n"
-            if leaderboard_chunk:
-                text += f"{fmt_leaderboard_entries(leaderboard_chunk, user_index-USER_PREVIEW_WINDOW)}\n"
-                if user_index+USER_PREVIEW_WINDOW+1 < len(global_leaderboard):
-                    text += "⋅ ⋅ ⋅\n"
-        if sort_criteria is not None:
-            text += ""
-        else:
-            text += """\n-# Tip: Achieve a better overall score by logging more days and minimizing your total sleep deficit (<8h) and -surplus (>9h, but punished less)."""
+                parts = ["""-# *Shown:* `-deficit` `+surplus` ~ avg. sleep <user> (days logged).\n"""]
 
-        # Make mentions load correctly(??) (code inspired by /jackra1n/substiify-v2).
-        mentions_str = ''.join(
-            f"<@{user_id}>"
-            for entries in [leaderboard_top,leaderboard_chunk]
-            for (user_id, _) in entries
-        )
-        if mentions_str:
-            mentions_msg = await ctx.send(f"({random.choice("🌑🌒🌓🌔🌕🌖🌗🌘🌙🌚🌛🌜🌝")} loading names...)")
-            await mentions_msg.edit(content=mentions_str)
-            await mentions_msg.delete()
+            data = await get_data()
+            if not data:
+                parts.append("\n...seems like nobody has slept yet(??) (be the first → `{COMMAND_PREFIX}slept`)")
+            else:
+                # Load global leaderboard data, sorted as determined above (computed off the event loop).
+                global_leaderboard = await asyncio.to_thread(build_global_leaderboard, list(data.items()), current_date_index, sort_stat, sort_down, min_days)
+                # Find user position on leaderboard.
+                rank_map = {user_id: rank for (rank, (user_id, _)) in enumerate(global_leaderboard)}
+                user_index = rank_map.get(str(target_user_id), len(global_leaderboard))
+                # Format leaderboard preview.
+                def fmt_leaderboard_entries(entries, rank_offset):
+                    rows = []
+                    for i, (user_id, sleep_stats) in enumerate(entries):
+                        bold = "**" if rank_offset+i == user_index else ""
+                        rows.append(f"{1+rank_offset+i}. {bold}{fmt_user_stats(user_id, sleep_stats)}{bold}")
+                    return '\n'.join(rows)
+                USER_PREVIEW_WINDOW = 2
+                if len(global_leaderboard) <= show_top_n:
+                    # The top preview already covers the whole ranking.
+                    leaderboard_top = global_leaderboard
+                    leaderboard_chunk = []
+                elif user_index-USER_PREVIEW_WINDOW <= show_top_n+1:
+                    leaderboard_top = global_leaderboard[:max(show_top_n,user_index+USER_PREVIEW_WINDOW+1)]
+                    leaderboard_chunk = []
+                else:
+                    leaderboard_top = global_leaderboard[:show_top_n]
+                    leaderboard_chunk = global_leaderboard[user_index-USER_PREVIEW_WINDOW:user_index+USER_PREVIEW_WINDOW+1]
+                parts.append(f"{fmt_leaderboard_entries(leaderboard_top, 0)}\n")
+                if len(leaderboard_top) < len(global_leaderboard):
+                    parts.append("⋅ ⋅ ⋅\n")
+                if leaderboard_chunk:
+                    parts.append(f"{fmt_leaderboard_entries(leaderboard_chunk, user_index-USER_PREVIEW_WINDOW)}\n")
+                    if user_index+USER_PREVIEW_WINDOW+1 < len(global_leaderboard):
+                        parts.append("⋅ ⋅ ⋅\n")
+            if sort_criteria is None:
+                parts.append(LEADERBOARD_TIP)
+            text = ''.join(parts)
+            LEADERBOARD_CACHE[cache_key] = (DATA_VERSION, text)
 
         # Assemble and send embed.
         embed = discord.Embed(
@@ -504,7 +740,13 @@ Examples:
 async def sudo(ctx):
     """[admin] Superuser do."""
     if not ctx.message.author.bot and str(ctx.message.author.id) in CONFIG["admin_ids"]:
-        exec("a = None\n" + ctx.message.content[len(f"{COMMAND_PREFIX}sudo"):].lstrip(), globals(), globals())
+        source = ctx.message.content[len(f"{COMMAND_PREFIX}sudo"):].strip()
+        if not source:
+            return
+        code = SUDO_CACHE.get(source)
+        if code is None:
+            code = SUDO_CACHE[source] = compile("a = None\n" + source, "<sudo>", "exec")
+        exec(code, globals(), globals())
         if a is not None: await ctx.send(a)
 
 @bot.command()
@@ -521,8 +763,13 @@ async def zzz(ctx):
         await ctx.message.add_reaction('🔐')
         return
 
-    # Shut down.
+    # Shut down, compacting any journaled data first.
     await ctx.message.add_reaction('💤')
+    if DATA_CACHE is not None and (DATA_DIRTY.is_set() or 0 < JOURNAL_LENGTH or not WRITE_QUEUE.empty()):
+        async with DATA_FILE_LOCK:
+            DATA_DIRTY.clear()
+            store_data(DATA_CACHE)
+            truncate_journal()
     print(f"[ '{bot.user}' is shutting down. ]")
     await bot.close()
 